@@ -24,8 +24,9 @@ bl_info = {
 import bpy
 import json
 import mathutils
+import numpy as np
 import os
-from bpy.props import StringProperty, PointerProperty, EnumProperty, BoolProperty
+from bpy.props import StringProperty, PointerProperty, EnumProperty, BoolProperty, FloatProperty
 from bpy_extras.io_utils import ImportHelper, ExportHelper
 
 
@@ -49,6 +50,355 @@ def update_target_armature(self, context):
         armature_mod.object = self.target_armature
 
 
+# Vectorized channel helpers
+# Quaternions are stored as (..., 4) arrays in Blender's WXYZ order
+
+def quat_multiply(a, b):
+    """Hamilton product of two quaternion arrays (same as Blender's a @ b)"""
+    aw, ax, ay, az = np.moveaxis(a, -1, 0)
+    bw, bx, by, bz = np.moveaxis(b, -1, 0)
+    return np.stack((
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    ), axis=-1)
+
+
+def quat_conjugate(q):
+    """Conjugate of a quaternion array (the inverse for unit quaternions)"""
+    return q * np.array((1.0, -1.0, -1.0, -1.0))
+
+
+def quat_normalize(q):
+    """Normalize a quaternion array, mapping zero-length quaternions to identity"""
+    norm = np.linalg.norm(q, axis=-1, keepdims=True)
+    identity = np.broadcast_to(np.array((1.0, 0.0, 0.0, 0.0)), q.shape)
+    return np.where(norm > 0.0, q / np.where(norm > 0.0, norm, 1.0), identity)
+
+
+def euler_to_quat(euler, order):
+    """Convert an (..., 3) Euler array with the given rotation order (e.g. 'XYZ') to quaternions"""
+    half = euler * 0.5
+    cos, sin = np.cos(half), np.sin(half)
+    axis_quats = {}
+    for i, axis in enumerate('XYZ'):
+        q = np.zeros(euler.shape[:-1] + (4,))
+        q[..., 0] = cos[..., i]
+        q[..., 1 + i] = sin[..., i]
+        axis_quats[axis] = q
+    # Blender applies the first axis of the order first, so it ends up rightmost
+    return quat_multiply(quat_multiply(axis_quats[order[2]], axis_quats[order[1]]), axis_quats[order[0]])
+
+
+def axis_angle_to_quat(axis_angle):
+    """Convert an (..., 4) array of Blender axis-angle values (angle, X, Y, Z) to quaternions"""
+    angle = axis_angle[..., :1]
+    axis = axis_angle[..., 1:]
+    norm = np.linalg.norm(axis, axis=-1, keepdims=True)
+    axis = axis / np.where(norm > 0.0, norm, 1.0)
+    q = np.concatenate((np.cos(angle * 0.5), axis * np.sin(angle * 0.5)), axis=-1)
+    return np.where(norm > 0.0, q, np.array((1.0, 0.0, 0.0, 0.0)))
+
+
+def sample_fcurve(fcurve, frames):
+    """Sample an fcurve at the given frames.
+
+    Keyed frames, constant and linear segments and constant extrapolation are
+    computed in bulk from the keyframe arrays. Only frames on Bezier/easing segments,
+    under linear extrapolation or on curves with modifiers go through fcurve.evaluate.
+    """
+    frames = np.asarray(frames, dtype=float)
+    values = np.empty(len(frames))
+    resolved = np.zeros(len(frames), dtype=bool)
+    count = len(fcurve.keyframe_points)
+
+    # Modifiers change the evaluated curve, so raw key values can't be trusted then
+    if count and not fcurve.modifiers:
+        co = np.empty(count * 2)
+        fcurve.keyframe_points.foreach_get('co', co)
+        keys_x, keys_y = co[0::2], co[1::2]
+        interpolation = np.empty(count, dtype=np.int32)
+        fcurve.keyframe_points.foreach_get('interpolation', interpolation)
+
+        # Segment i runs from key i to key i + 1 and uses key i's interpolation
+        segment = np.searchsorted(keys_x, frames, side='right') - 1
+        inside = (segment >= 0) & (segment < count - 1)
+        segment_mode = interpolation[np.clip(segment, 0, count - 1)]
+
+        constant = inside & (segment_mode == 0)  # 'CONSTANT'
+        values[constant] = keys_y[segment[constant]]
+        linear = inside & (segment_mode == 1)  # 'LINEAR'
+        values[linear] = np.interp(frames[linear], keys_x, keys_y)
+        resolved = constant | linear
+
+        if fcurve.extrapolation == 'CONSTANT':
+            before, after = segment < 0, segment >= count - 1
+            values[before] = keys_y[0]
+            values[after] = keys_y[-1]
+            resolved |= before | after
+
+        index = np.clip(np.searchsorted(keys_x, frames), 0, count - 1)
+        keyed = np.isclose(keys_x[index], frames)
+        values[keyed] = keys_y[index[keyed]]
+        resolved |= keyed
+
+    for i in np.flatnonzero(~resolved):
+        values[i] = fcurve.evaluate(frames[i])
+    return values
+
+
+def switch_to_quaternion_mode(posebone):
+    """Switch a pose bone to quaternion rotation, remembering its Euler order for later export"""
+    if posebone.rotation_mode not in ('QUATERNION', 'AXIS_ANGLE'):
+        posebone["livepose_euler_order"] = posebone.rotation_mode
+    posebone.rotation_mode = 'QUATERNION'
+
+
+def rotation_mode_path(rotation_mode):
+    """Name of the pose bone rotation property Blender evaluates for a rotation mode"""
+    return {
+        'QUATERNION': 'rotation_quaternion',
+        'AXIS_ANGLE': 'rotation_axis_angle',
+    }.get(rotation_mode, 'rotation_euler')
+
+
+def sample_bone_channels(action, posebones, frames, rest_defaults=False, use_rotation_mode=False):
+    """Sample location, rotation and scale of pose bones across frames of an action.
+
+    Returns (location, quaternion, scale) arrays shaped (bones, frames, 3/4/3).
+    Rotations are read from whichever rotation channel is keyed in the action
+    (quaternion, then Euler, then axis-angle) and converted to quaternions. Only bones
+    with no keyed rotation use their current rotation mode.
+    Channels without an fcurve (or all channels if action is None) fall back to the
+    pose bone's current value, or to the rest pose if rest_defaults is set.
+
+    Euler keys are converted with the bone's Euler rotation mode, or the order recorded by
+    switch_to_quaternion_mode. Raises ValueError if neither is known for a bone.
+
+    With use_rotation_mode, rotations are instead read from the channel selected by each
+    bone's rotation_mode, which is what Blender evaluates, even if other rotation
+    channels are keyed.
+    """
+    frames = np.asarray(frames, dtype=float)
+    fcurves = {}
+    if action:
+        fcurves = {(fc.data_path, fc.array_index): fc for fc in action.fcurves}
+    keyed_paths = {path for path, index in fcurves}
+
+    rest_values = {
+        'location': (0.0, 0.0, 0.0),
+        'rotation_quaternion': (1.0, 0.0, 0.0, 0.0),
+        'rotation_euler': (0.0, 0.0, 0.0),
+        'rotation_axis_angle': (0.0, 0.0, 1.0, 0.0),
+        'scale': (1.0, 1.0, 1.0),
+    }
+
+    def read_channel(posebone, prop):
+        default = rest_values[prop] if rest_defaults else tuple(getattr(posebone, prop))
+        path = posebone.path_from_id(prop)
+        out = np.empty((len(frames), len(default)))
+        for i, value in enumerate(default):
+            fcurve = fcurves.get((path, i))
+            out[:, i] = value if fcurve is None else sample_fcurve(fcurve, frames)
+        return out
+
+    location = np.empty((len(posebones), len(frames), 3))
+    quaternion = np.empty((len(posebones), len(frames), 4))
+    scale = np.empty((len(posebones), len(frames), 3))
+    unknown_order = []
+
+    for b, posebone in enumerate(posebones):
+        location[b] = read_channel(posebone, 'location')
+        scale[b] = read_channel(posebone, 'scale')
+
+        # The bake switches bones to quaternions, so trust the keyed channels over rotation_mode
+        rotation_prop = None
+        if not use_rotation_mode:
+            for prop in ('rotation_quaternion', 'rotation_euler', 'rotation_axis_angle'):
+                if posebone.path_from_id(prop) in keyed_paths:
+                    rotation_prop = prop
+                    break
+        if rotation_prop is None:
+            rotation_prop = rotation_mode_path(posebone.rotation_mode)
+
+        if rotation_prop == 'rotation_quaternion':
+            quaternion[b] = read_channel(posebone, 'rotation_quaternion')
+        elif rotation_prop == 'rotation_axis_angle':
+            quaternion[b] = axis_angle_to_quat(read_channel(posebone, 'rotation_axis_angle'))
+        else:
+            # A pose bone's Euler has no order of its own, Blender derives it from rotation_mode
+            if posebone.rotation_mode not in ('QUATERNION', 'AXIS_ANGLE'):
+                order = posebone.rotation_mode
+            else:
+                order = posebone.get("livepose_euler_order")
+            if order is None:
+                unknown_order.append(posebone.name)
+                continue
+            quaternion[b] = euler_to_quat(read_channel(posebone, 'rotation_euler'), order)
+
+    if unknown_order:
+        raise ValueError(f"Euler rotation order unknown for {len(unknown_order)} bones keyed in Euler but not in an Euler rotation mode: {', '.join(unknown_order[:5])}{'...' if len(unknown_order) > 5 else ''}")
+
+    return location, quaternion, scale
+
+
+def compute_livepose_deltas(posed, reference):
+    """Compute the LivePose delta that turns the reference channels into the posed ones.
+
+    Location is an additive offset and rotation is post-multiplied (posed = reference @ delta),
+    the inverse of apply_transform_to_bone. Scale is written as the LivePose factor
+    (posed / reference), unlike apply_transform_to_bone which adds it.
+    Both arguments are (location, quaternion, scale) tuples from sample_bone_channels.
+    """
+    loc, quat, scale = posed
+    ref_loc, ref_quat, ref_scale = reference
+
+    delta_quat = quat_multiply(quat_conjugate(quat_normalize(ref_quat)), quat_normalize(quat))
+    # Keep W positive so equivalent rotations compare and serialize consistently
+    delta_quat = np.where(delta_quat[..., :1] < 0.0, -delta_quat, delta_quat)
+
+    # A zero reference scale has no meaningful factor, treat it as unchanged
+    scale_factor = np.divide(scale, ref_scale, out=np.ones_like(scale), where=ref_scale != 0.0)
+
+    return loc - ref_loc, delta_quat, scale_factor
+
+
+def build_livepose_data(bone_names, deltas, apply_mode, tolerance):
+    """Build a LivePose dict for a single frame of deltas, skipping identity bones.
+
+    deltas is a (location, quaternion, scale factor) tuple of (bones, 3/4/3) arrays.
+    Only the channels selected by apply_mode and outside the tolerance are written,
+    so unchanged channels are left out instead of being written as zero offsets.
+    """
+    d_loc, d_quat, d_scale = deltas
+    bone_count = len(bone_names)
+    no_change = np.zeros(bone_count, dtype=bool)
+
+    # Decide per bone and per channel whether it is outside the tolerance
+    write_pos = no_change
+    write_rot = no_change
+    write_scale = no_change
+    if apply_mode in ['ALL', 'POSITION', 'ROT_POS']:
+        write_pos = np.abs(d_loc).max(axis=-1) > tolerance
+    if apply_mode in ['ALL', 'ROTATION', 'ROT_POS']:
+        write_rot = np.abs(d_quat[:, 1:]).max(axis=-1) > tolerance
+    if apply_mode in ['ALL', 'SCALE']:
+        write_scale = np.abs(d_scale - 1.0).max(axis=-1) > tolerance
+
+    data = []
+    for b in np.flatnonzero(write_pos | write_rot | write_scale):
+        transform = {}
+        if write_pos[b]:
+            x, y, z = d_loc[b].tolist()
+            transform['Position'] = {"X": x, "Y": y, "Z": z}
+        if write_rot[b]:
+            w, x, y, z = d_quat[b].tolist()
+            # LivePose stores quaternions as XYZW
+            transform['Rotation'] = {"X": x, "Y": y, "Z": z, "W": w}
+        if write_scale[b]:
+            # Scale is a factor (1.0 is identity), as in files written by SimpleHeels
+            x, y, z = d_scale[b].tolist()
+            transform['Scale'] = {"X": x, "Y": y, "Z": z}
+
+        data.append({
+            "BonePoseInfoId": {"BoneName": bone_names[b]},
+            "Stacks": [{"Transform": transform}],
+        })
+
+    return {"Data": data}
+
+
+def livepose_transform_arrays(transforms):
+    """Convert LivePose Transform dicts to (location, quaternion, scale) arrays shaped (bones, 3/4/3).
+
+    Missing channels and identity rotations become no-op offsets, matching apply_transform_to_bone.
+    """
+    loc = np.zeros((len(transforms), 3))
+    quat = np.tile((1.0, 0.0, 0.0, 0.0), (len(transforms), 1))
+    scale = np.zeros((len(transforms), 3))
+
+    for b, transform in enumerate(transforms):
+        if 'Position' in transform:
+            pos = transform['Position']
+            loc[b] = (pos['X'], pos['Y'], pos['Z'])
+        if 'Rotation' in transform and not transform['Rotation'].get('IsIdentity', False):
+            rot = transform['Rotation']
+            quat[b] = (rot['W'], rot['X'], rot['Y'], rot['Z'])
+        if 'Scale' in transform:
+            s = transform['Scale']
+            scale[b] = (s['X'], s['Y'], s['Z'])
+
+    return loc, quat_normalize(quat), scale
+
+
+def compose_livepose(channels, transforms, apply_mode, invert=False):
+    """Vectorized equivalent of apply_transform_to_bone.
+
+    channels is a (location, quaternion, scale) tuple shaped (bones, frames, 3/4/3),
+    transforms the matching (bones, 3/4/3) tuple from livepose_transform_arrays.
+    """
+    loc, quat, scale = channels
+    t_loc, t_quat, t_scale = (t[:, np.newaxis] for t in transforms)
+    mult = -1.0 if invert else 1.0
+
+    if apply_mode in ['ALL', 'POSITION', 'ROT_POS']:
+        loc = loc + t_loc * mult
+    if apply_mode in ['ALL', 'ROTATION', 'ROT_POS']:
+        quat = quat_multiply(quat, quat_conjugate(t_quat) if invert else t_quat)
+    if apply_mode in ['ALL', 'SCALE']:
+        scale = scale + t_scale * mult
+
+    return loc, quat, scale
+
+
+def channel_errors(actual, expected):
+    """Per-bone max positional, angular (radians) and scale error between two channel tuples"""
+    loc, quat, scale = actual
+    exp_loc, exp_quat, exp_scale = expected
+
+    # q and -q are the same rotation, so compare on |dot|
+    dot = np.abs(np.sum(quat_normalize(quat) * quat_normalize(exp_quat), axis=-1))
+    angle = 2.0 * np.arccos(np.clip(dot, 0.0, 1.0))
+
+    return (
+        np.abs(loc - exp_loc).max(axis=(1, 2), initial=0.0),
+        angle.max(axis=1, initial=0.0),
+        np.abs(scale - exp_scale).max(axis=(1, 2), initial=0.0),
+    )
+
+
+def verify_livepose_bake(before, after, transforms, apply_mode, invert, tolerance, mode_switched=None):
+    """Compare a before/after snapshot of baked channels against the expected LivePose composition.
+
+    Returns a dict of per-bone arrays: position/angle/scale errors, plus 'mismatch',
+    'skipped' (left unchanged although a change was expected), 'double_applied'
+    (matches the offset applied twice) and 'mode_switched' masks. mode_switched marks
+    bones whose rotation_mode changed away from their keyed rotation channel; they are
+    always reported as mismatched.
+    """
+    expected = compose_livepose(before, transforms, apply_mode, invert)
+    pos_err, angle_err, scale_err = channel_errors(after, expected)
+    mismatch = (pos_err > tolerance) | (angle_err > tolerance) | (scale_err > tolerance)
+    if mode_switched is None:
+        mode_switched = np.zeros_like(mismatch)
+    mismatch |= mode_switched
+
+    unchanged = np.all([err <= tolerance for err in channel_errors(after, before)], axis=0)
+    applied_twice = compose_livepose(expected, transforms, apply_mode, invert)
+    doubled = np.all([err <= tolerance for err in channel_errors(after, applied_twice)], axis=0)
+
+    return {
+        'position_error': pos_err,
+        'angle_error': angle_err,
+        'scale_error': scale_err,
+        'mismatch': mismatch,
+        'skipped': mismatch & unchanged,
+        'double_applied': mismatch & doubled & ~unchanged,
+        'mode_switched': mode_switched,
+    }
+
+
 class LivePoseSettings(bpy.types.PropertyGroup):
     target_armature: PointerProperty(
         name='Target Armature',
@@ -89,6 +439,20 @@ class LivePoseSettings(bpy.types.PropertyGroup):
         default=False
     ) # type: ignore
     
+    verify_bake: bpy.props.BoolProperty(
+        name="Verify Bake",
+        description="After applying to an animation, check every keyframe against the expected result and report per-bone errors",
+        default=True
+    ) # type: ignore
+
+    verify_tolerance: FloatProperty(
+        name="Verify Tolerance",
+        description="Maximum position, angle (radians) or scale error before a bone is reported as mismatched",
+        default=1e-4,
+        min=0.0,
+        precision=6
+    ) # type: ignore
+
     gltf_export_path: StringProperty(
         name="Export Path",
         description="Path where the GLTF file will be exported",
@@ -102,6 +466,26 @@ class LivePoseSettings(bpy.types.PropertyGroup):
         default="export"
     ) # type: ignore
     
+    export_reference_action: PointerProperty(
+        name="Reference Action",
+        description="Action to diff against when exporting (sampled at the same frames). Leave empty to diff against the rest pose",
+        type=bpy.types.Action
+    ) # type: ignore
+
+    export_from_animation: bpy.props.BoolProperty(
+        name="Export Every Frame",
+        description="Export one LivePose file per keyframe of the active action instead of the current pose",
+        default=False
+    ) # type: ignore
+
+    export_tolerance: FloatProperty(
+        name="Tolerance",
+        description="Bones whose exported delta stays within this tolerance are treated as identity and skipped",
+        default=1e-5,
+        min=0.0,
+        precision=6
+    ) # type: ignore
+
     pose_was_applied: bpy.props.BoolProperty(default=False) # type: ignore
 
 
@@ -133,6 +517,10 @@ class LIVEPOSE_PT_MainPanel(bpy.types.Panel):
         box.prop(settings, "apply_mode", text="")
         box.prop(settings, "apply_to_animation", text="Apply to Animation")
         box.prop(settings, "invert_transform", text="Invert (Remove)")
+        row = box.row()
+        row.enabled = settings.apply_to_animation
+        row.prop(settings, "verify_bake", text="Verify Bake")
+        row.prop(settings, "verify_tolerance", text="Tol. (m / rad / scale)")
 
         # Action Buttons
         layout.separator()
@@ -148,7 +536,17 @@ class LIVEPOSE_PT_MainPanel(bpy.types.Panel):
             layout.separator()
             box = layout.box()
             box.label(text="Pose has been applied", icon="CHECKMARK")
-        
+
+        # LivePose Export
+        layout.separator()
+        box = layout.box()
+        box.label(text='Export LivePose:', icon='EXPORT')
+        box.prop(settings, "export_reference_action", text="Reference")
+        box.prop(settings, "export_tolerance")
+        box.prop(settings, "export_from_animation", text="Export Every Frame")
+        row = box.row()
+        row.operator("livepose.export_pose", text="Export LivePose", icon="EXPORT")
+
         # Action Management
         layout.separator()
         box = layout.box()
@@ -314,7 +712,18 @@ class LIVEPOSE_OT_ApplyPose(bpy.types.Operator):
         frame_numbers = sorted(frame_numbers)
         original_frame = context.scene.frame_current
         modified_bones = set()
-        
+
+        # Snapshot the channels before baking so the result can be verified afterwards
+        verify_bake = settings.verify_bake
+        if verify_bake:
+            verify_bones = [target_armature.pose.bones[bone_name] for bone_name in bone_transforms]
+            modes_before = [posebone.rotation_mode for posebone in verify_bones]
+            try:
+                before = sample_bone_channels(action, verify_bones, frame_numbers)
+            except ValueError as e:
+                self.report({'WARNING'}, f"Skipping bake verification: {str(e)}")
+                verify_bake = False
+
         self.report({'INFO'}, f"Processing {len(frame_numbers)} frames from {min(frame_numbers)} to {max(frame_numbers)}")
         
         # Process each frame individually
@@ -340,7 +749,7 @@ class LIVEPOSE_OT_ApplyPose(bpy.types.Operator):
                     if posebone.location != original_loc:
                         posebone.keyframe_insert(data_path="location", frame=frame)
                 if settings.apply_mode in ['ALL', 'ROTATION', 'ROT_POS']:
-                    posebone.rotation_mode = 'QUATERNION'
+                    switch_to_quaternion_mode(posebone)
                     if posebone.rotation_quaternion != original_rot:
                         posebone.keyframe_insert(data_path="rotation_quaternion", frame=frame)
                 if settings.apply_mode in ['ALL', 'SCALE']:
@@ -355,9 +764,80 @@ class LIVEPOSE_OT_ApplyPose(bpy.types.Operator):
         
         action_text = "Removed" if settings.invert_transform else "Applied"
         self.report({'INFO'}, f"{action_text} LivePose offset to {len(modified_bones)} bones across {len(frame_numbers)} keyframes")
+
+        if verify_bake:
+            # Read the result the way Blender evaluates it under the post-bake rotation modes
+            after = sample_bone_channels(action, verify_bones, frame_numbers, use_rotation_mode=True)
+
+            # A mode switch orphans the old rotation keys, even where the sampled values look right
+            keyed_paths = {fcurve.data_path for fcurve in action.fcurves}
+            mode_switched = np.array([
+                posebone.rotation_mode != mode
+                and posebone.path_from_id(rotation_mode_path(mode)) in keyed_paths
+                for posebone, mode in zip(verify_bones, modes_before)
+            ], dtype=bool)
+
+            self.report_bake_verification(list(bone_transforms), before, after, list(bone_transforms.values()), mode_switched, settings)
+
         settings.pose_was_applied = True
         return {'FINISHED'}
-    
+
+    def report_bake_verification(self, bone_names, before, after, transforms, mode_switched, settings):
+        """Compare the baked channels against the expected composition and report problem bones"""
+        tolerance = settings.verify_tolerance
+        result = verify_livepose_bake(
+            before,
+            after,
+            livepose_transform_arrays(transforms),
+            settings.apply_mode,
+            settings.invert_transform,
+            tolerance,
+            mode_switched
+        )
+
+        max_pos = result['position_error'].max(initial=0.0)
+        max_angle = np.degrees(result['angle_error'].max(initial=0.0))
+        max_scale = result['scale_error'].max(initial=0.0)
+
+        mismatched = np.flatnonzero(result['mismatch'])
+        if not len(mismatched):
+            self.report({'INFO'}, f"Bake verified for {len(bone_names)} bones (max error: pos {max_pos:.6f} m, rot {max_angle:.4f} deg, scale {max_scale:.6f})")
+            return
+
+        def status(b):
+            if result['mode_switched'][b]:
+                return "rotation mode switched, old keys ignored"
+            if result['skipped'][b]:
+                return "skipped"
+            if result['double_applied'][b]:
+                return "double-applied"
+            return "mismatch"
+
+        # Per-bone details go to the Info editor
+        for b in mismatched:
+            self.report({'INFO'}, f"Bake verification: {bone_names[b]} {status(b)} (pos {result['position_error'][b]:.6f} m, "
+                                  f"rot {np.degrees(result['angle_error'][b]):.4f} deg, scale {result['scale_error'][b]:.6f})")
+
+        # The status bar gets the worst bone per channel, since the units can't be compared
+        worst = []
+        for label, key, unit, convert in (
+            ("pos", 'position_error', " m", float),
+            ("rot", 'angle_error', " deg", np.degrees),
+            ("scale", 'scale_error', "", float),
+        ):
+            errors = result[key]
+            if errors.max(initial=0.0) > tolerance:
+                b = int(np.argmax(errors))
+                worst.append(f"{label} {bone_names[b]} {convert(errors[b]):.4f}{unit} ({status(b)})")
+
+        switched = np.flatnonzero(result['mode_switched'])
+        if len(switched):
+            worst.append(f"rotation mode switched on {bone_names[switched[0]]}{f' and {len(switched) - 1} more' if len(switched) > 1 else ''}")
+
+        skipped_count = int(result['skipped'].sum())
+        double_count = int(result['double_applied'].sum())
+        self.report({'WARNING'}, f"Bake verification failed for {len(mismatched)} bones ({skipped_count} skipped, {double_count} double-applied, {len(switched)} mode-switched). Worst: {'; '.join(worst)}. See the Info editor for all bones")
+
     def apply_transform_to_bone(self, posebone, transform, apply_mode, invert=False):
         """Apply a transform to a pose bone"""
         # Invert multiplier for remove operation
@@ -374,7 +854,7 @@ class LIVEPOSE_OT_ApplyPose(bpy.types.Operator):
             rot = transform['Rotation']
             # Skip identity rotations
             if not (rot.get('IsIdentity', False)):
-                posebone.rotation_mode = 'QUATERNION'
+                switch_to_quaternion_mode(posebone)
                 # LivePose stores quaternions as XYZW, Blender uses WXYZ
                 rot_quat = mathutils.Quaternion((
                     rot['W'], rot['X'], rot['Y'], rot['Z']
@@ -429,6 +909,103 @@ class LIVEPOSE_OT_ResetPose(bpy.types.Operator):
         return {'FINISHED'}
 
 
+class LIVEPOSE_OT_ExportPose(bpy.types.Operator, ExportHelper):
+    bl_idname = "livepose.export_pose"
+    bl_label = "Export LivePose"
+    bl_description = "Export the difference between the current pose (or every keyframe of the active action) and a reference pose as LivePose"
+    bl_options = {'REGISTER'}
+
+    filename_ext = ".livepose"
+
+    filter_glob: StringProperty(
+        default="*.livepose",
+        options={'HIDDEN'}
+    ) # type: ignore
+
+    @classmethod
+    def poll(cls, context):
+        if context.mode != 'OBJECT':
+            return False
+        settings = context.scene.livepose_settings
+        if not settings.target_armature:
+            return False
+        return True
+
+    def execute(self, context):
+        settings = context.scene.livepose_settings
+        target_armature = settings.target_armature
+        posebones = list(target_armature.pose.bones)
+        bone_names = [posebone.name for posebone in posebones]
+
+        # Pick the frames to export
+        if settings.export_from_animation:
+            if not target_armature.animation_data or not target_armature.animation_data.action:
+                self.report({'ERROR'}, "No active action found on armature. Please select an animation action first.")
+                return {'CANCELLED'}
+
+            action = target_armature.animation_data.action
+            frame_numbers = set()
+            for fcurve in action.fcurves:
+                for keyframe in fcurve.keyframe_points:
+                    frame_numbers.add(int(keyframe.co[0]))
+
+            if not frame_numbers:
+                self.report({'WARNING'}, "No keyframes found in action")
+                return {'CANCELLED'}
+
+            frame_numbers = sorted(frame_numbers)
+            # Unkeyed channels use the rest pose, like the reference, so manual tweaks
+            # left on the armature don't leak into every exported frame
+            posed_action = action
+        else:
+            # Without an action every channel falls back to the current pose bone values
+            frame_numbers = [context.scene.frame_current]
+            posed_action = None
+
+        try:
+            posed = sample_bone_channels(posed_action, posebones, frame_numbers, rest_defaults=posed_action is not None)
+            # Reference is either another action at the same frames or the rest pose
+            reference = sample_bone_channels(settings.export_reference_action, posebones, frame_numbers, rest_defaults=True)
+        except ValueError as e:
+            self.report({'ERROR'}, f"Cannot export LivePose: {str(e)}")
+            return {'CANCELLED'}
+
+        d_loc, d_quat, d_scale = compute_livepose_deltas(posed, reference)
+
+        base_path, ext = os.path.splitext(self.filepath)
+        written_files = 0
+        written_bones = 0
+
+        try:
+            for f, frame in enumerate(frame_numbers):
+                livepose_data = build_livepose_data(
+                    bone_names,
+                    (d_loc[:, f], d_quat[:, f], d_scale[:, f]),
+                    settings.apply_mode,
+                    settings.export_tolerance
+                )
+
+                if settings.export_from_animation:
+                    filepath = f"{base_path}_{frame:04d}{ext}"
+                else:
+                    filepath = self.filepath
+
+                with open(filepath, 'w') as file:
+                    json.dump(livepose_data, file, indent=2)
+
+                written_files += 1
+                written_bones = max(written_bones, len(livepose_data['Data']))
+        except Exception as e:
+            self.report({'ERROR'}, f"Failed to write LivePose file: {str(e)}")
+            return {'CANCELLED'}
+
+        if settings.export_from_animation:
+            self.report({'INFO'}, f"Exported {written_files} LivePose frames ({written_bones} bones max) to {os.path.dirname(self.filepath)}")
+        else:
+            self.report({'INFO'}, f"Exported LivePose with {written_bones} bones: {os.path.basename(self.filepath)}")
+        return {'FINISHED'}
+
+
 class LIVEPOSE_OT_ImportGLTF(bpy.types.Operator, ImportHelper):
     bl_idname = "livepose.import_gltf"
     bl_label = "Import GLTF"
@@ -658,6 +1235,7 @@ classes = (
     LIVEPOSE_PT_MainPanel,
     LIVEPOSE_OT_ApplyPose,
     LIVEPOSE_OT_ResetPose,
+    LIVEPOSE_OT_ExportPose,
     LIVEPOSE_OT_ImportGLTF,
     LIVEPOSE_OT_ExportGLTF,
     LIVEPOSE_OT_DeleteOtherActions,